@@ -12,21 +12,82 @@ Author: Generated Script
 Date: 2025
 """
 
+import argparse
+import numpy as np
 import pandas as pd
 import sys
 import os
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime # Added import
 
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
 
-def process_csv_file(input_file_path, output_directory=None):
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pac
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
+# The three summary reports, shared by every backend:
+# (column index, output column name, filename prefix, value substituted for
+#  null rows -- None means drop them)
+# Column C = index 2, Column E = index 4, Column H = index 7
+SUMMARY_SPECS = [
+    (4, 'Operating System', 'os_summary', 'Unknown'),
+    (2, 'Hostname', 'hostname_summary', None),
+    (7, 'Vulnerability', 'vuln', None),
+]
+
+# Placeholder tokens treated as missing values by every backend
+NULL_TOKENS = ['', 'nan', 'NaN', 'null', 'NULL']
+NULL_TOKEN_SET = frozenset(NULL_TOKENS)
+
+
+def clean_token(value):
+    """Strip one raw value, returning None for placeholder/empty tokens."""
+    value = value.strip()
+    if value in NULL_TOKEN_SET:
+        return None
+    return value
+
+# Serializes console output from the concurrent summary workers
+PRINT_LOCK = threading.Lock()
+
+
+def process_csv_file(input_file_path, output_directory=None, backend="polars",
+                     output_format="csv"):
     """
     Process the input CSV file and generate three summary reports.
-    
+
     Args:
         input_file_path (str): Path to the input CSV file
-        output_directory (str, optional): Directory to save output files. 
+        output_directory (str, optional): Directory to save output files.
                                         Defaults to same directory as input file.
+        backend (str): Processing backend: "polars" (default), "pandas", or
+                       "duckdb". The polars backend reads only the needed
+                       columns and builds all three summaries from a single
+                       file scan; the duckdb backend runs the summaries as
+                       grouped-count SQL queries.
+        output_format (str): Output file format, "csv" (default) or
+                             "parquet". Parquet is columnar, compressed, and
+                             much faster to write and to re-read downstream.
     """
     
     # Validate input file exists
@@ -47,33 +108,92 @@ def process_csv_file(input_file_path, output_directory=None):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     try:
+        # Hint the kernel to prefetch the file sequentially before parsing
+        prefetch_file(input_file_path)
+
+        if backend == "polars":
+            if POLARS_AVAILABLE:
+                return process_with_polars(input_file_path, output_directory, timestamp,
+                                           output_format)
+            print("Warning: polars is not installed. Falling back to the pandas backend.")
+
+        if backend == "duckdb":
+            if DUCKDB_AVAILABLE:
+                return process_with_duckdb(input_file_path, output_directory, timestamp,
+                                           output_format)
+            print("Warning: duckdb is not installed. Falling back to the pandas backend.")
+
         # Read the CSV file
         print(f"Reading CSV file: {input_file_path}")
-        df = pd.read_csv(input_file_path)
-        
-        # Verify the CSV has enough columns
-        if len(df.columns) < 8:
-            print(f"Warning: CSV file has only {len(df.columns)} columns. Expected at least 8 columns.")
-            print("Proceeding with available columns...")
-        
-        # Extract relevant columns (using 0-based indexing)
-        # Column C = index 2, Column E = index 4, Column H = index 7
-        hostnames = df.iloc[:, 2] if len(df.columns) > 2 else pd.Series(dtype=str)  # Column C
-        operating_systems = df.iloc[:, 4] if len(df.columns) > 4 else pd.Series(dtype=str)  # Column E
-        vulnerabilities = df.iloc[:, 7] if len(df.columns) > 7 else pd.Series(dtype=str)  # Column H
-        
-        # Process Operating Systems Summary
-        print("Processing Operating Systems summary...")
-        os_summary_path = process_os_summary(operating_systems, output_directory, timestamp)
-        
-        # Process Hostnames Summary
-        print("Processing Hostnames summary...")
-        hostname_summary_path = process_hostname_summary(hostnames, output_directory, timestamp)
-        
-        # Process Vulnerabilities Summary
-        print("Processing Vulnerabilities summary...")
-        vuln_summary_path = process_vulnerability_summary(vulnerabilities, output_directory, timestamp)
-        
+
+        # Resolve and validate the columns from the header row alone, so
+        # malformed or narrow files are flagged before any heavy parsing
+        header, wanted_indexes = resolve_columns(input_file_path)
+
+        if PYARROW_AVAILABLE:
+            hostnames, operating_systems, vulnerabilities = read_columns_with_pyarrow(
+                input_file_path, header, wanted_indexes)
+
+            # Stack the three columns into one long frame so cleaning and
+            # counting run as a single pass instead of three
+            long_values = pd.concat([
+                pd.DataFrame({'kind': 'host', 'value': hostnames}),
+                pd.DataFrame({'kind': 'os', 'value': operating_systems}),
+                pd.DataFrame({'kind': 'vuln', 'value': vulnerabilities}),
+            ], ignore_index=True)
+
+            # Clean the data: strip whitespace and handle null/empty values.
+            # The pyarrow-backed string dtype keeps strip/isin in Arrow's C++
+            # kernels instead of iterating Python objects.
+            cleaned = ensure_string(long_values['value']).str.strip()
+            cleaned = cleaned.mask(cleaned.isin(NULL_TOKENS))
+            long_values['value'] = cleaned
+
+            # OS keeps empty rows as 'Unknown'; hostname/vulnerability drop them
+            long_values.loc[(long_values['kind'] == 'os') & long_values['value'].isna(), 'value'] = 'Unknown'
+            long_values = long_values.dropna(subset=['value'])
+
+            # Split the cleaned frame once so each summary worker receives
+            # its own pre-cleaned Series and jumps straight to counting,
+            # instead of re-filtering the long frame per summary
+            cleaned_groups = dict(iter(long_values.groupby('kind', sort=False,
+                                                           observed=True)['value']))
+            empty = pd.Series(dtype=str)
+            count_sources = {
+                kind: partial(count_values, cleaned_groups.get(kind, empty))
+                for kind in ('host', 'os', 'vuln')
+            }
+        else:
+            # Without pyarrow, stream the file in chunks so memory stays
+            # bounded regardless of file size
+            host_counts, os_counts, vuln_counts = count_columns_chunked(
+                input_file_path, wanted_indexes)
+            count_sources = {
+                'host': lambda: host_counts,
+                'os': lambda: os_counts,
+                'vuln': lambda: vuln_counts,
+            }
+
+        # One parametrized summary routine serves all three reports
+        def run_summary(kind, column_name, filename_prefix):
+            with PRINT_LOCK:
+                print(f"Processing {column_name} summary...")
+            return write_counts(count_sources[kind](), column_name, filename_prefix,
+                                output_directory, timestamp, output_format)
+
+        # The three summaries are independent and the heavy Arrow/pandas
+        # kernels release the GIL, so count and write them concurrently
+        kind_for_index = {2: 'host', 4: 'os', 7: 'vuln'}
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(run_summary, kind_for_index[column_index],
+                                column_name, prefix)
+                for column_index, column_name, prefix, _ in SUMMARY_SPECS
+            ]
+            os_summary_path, hostname_summary_path, vuln_summary_path = [
+                future.result() for future in futures
+            ]
+
         print("\nSummary Reports Generated Successfully!")
         if os_summary_path:
             print(f"- OS Summary: {os_summary_path}")
@@ -89,128 +209,407 @@ def process_csv_file(input_file_path, output_directory=None):
         return False
 
 
-def process_os_summary(os_column, output_dir, timestamp):
+def prefetch_file(input_file_path):
     """
-    Process operating systems data and create summary CSV.
-    
+    Advise the kernel that the file will be read sequentially in full.
+
+    On platforms with posix_fadvise this maximizes read-ahead bandwidth for
+    the cold-cache first read; elsewhere it is a no-op.
+
     Args:
-        os_column (pd.Series): Series containing operating system data
-        output_dir (str): Directory to save the output file
-        timestamp (str): Timestamp string to append to the filename
-    
-    Returns:
-        str: Path to the saved CSV file or None if error
+        input_file_path (str): Path to the input CSV file
     """
-    
-    # Clean the data: strip whitespace and handle null/empty values
-    os_cleaned = os_column.astype(str).str.strip()
-    
-    # Replace empty strings, 'nan', and whitespace-only strings with 'Unknown'
-    os_cleaned = os_cleaned.replace(['', 'nan', 'NaN', 'null', 'NULL'], 'Unknown')
-    os_cleaned = os_cleaned.replace(r'^\s*$', 'Unknown', regex=True)
-    
-    # Count occurrences of each OS
-    os_counts = os_cleaned.value_counts().reset_index()
-    os_counts.columns = ['Operating System', 'Count']
-    
-    # Sort alphabetically by Operating System
-    os_counts = os_counts.sort_values('Operating System').reset_index(drop=True)
-    
-    # Save to CSV
-    filename = f'os_summary_{timestamp}.csv'
-    output_path = os.path.join(output_dir, filename)
+
+    if not hasattr(os, 'posix_fadvise'):
+        return
     try:
-        os_counts.to_csv(output_path, index=False)
-        print(f"  - Saved OS summary to: {output_path}")
-        print(f"  - Found {len(os_counts)} unique operating systems")
-        return output_path
-    except Exception as e:
-        print(f"  - Error saving OS summary: {e}")
-        return None
+        fd = os.open(input_file_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
 
 
-def process_hostname_summary(hostname_column, output_dir, timestamp):
+def resolve_columns(input_file_path):
     """
-    Process hostnames data and create summary CSV.
-    
+    Peek at the header row and resolve which summary columns are present.
+
+    Only the header line is parsed, so narrow files are flagged before any
+    full-file work starts.
+
     Args:
-        hostname_column (pd.Series): Series containing hostname data
-        output_dir (str): Directory to save the output file
-        timestamp (str): Timestamp string to append to the filename
+        input_file_path (str): Path to the input CSV file
 
     Returns:
-        str: Path to the saved CSV file or None if error
+        tuple: (header, wanted_indexes) where wanted_indexes lists which of
+               columns 2, 4, and 7 exist in the file
     """
-    
-    # Clean the data: strip whitespace and remove null/empty values
-    hostname_cleaned = hostname_column.astype(str).str.strip()
-    
-    # Remove empty strings, 'nan', and whitespace-only strings
-    hostname_cleaned = hostname_cleaned.replace(['', 'nan', 'NaN', 'null', 'NULL'], pd.NA)
-    hostname_cleaned = hostname_cleaned.replace(r'^\s*$', pd.NA, regex=True)
-    
-    # Drop null values for hostname processing
-    hostname_cleaned = hostname_cleaned.dropna()
-    
-    # Count occurrences of each hostname
-    hostname_counts = hostname_cleaned.value_counts().reset_index()
-    hostname_counts.columns = ['Hostname', 'Count']
-    
-    # Sort alphabetically by Hostname
-    hostname_counts = hostname_counts.sort_values('Hostname').reset_index(drop=True)
-    
-    # Save to CSV
-    filename = f'hostname_summary_{timestamp}.csv'
-    output_path = os.path.join(output_dir, filename)
-    try:
-        hostname_counts.to_csv(output_path, index=False)
-        print(f"  - Saved hostname summary to: {output_path}")
-        print(f"  - Found {len(hostname_counts)} unique hostnames")
-        return output_path
-    except Exception as e:
-        print(f"  - Error saving hostname summary: {e}")
-        return None
 
-def process_vulnerability_summary(vuln_column, output_dir, timestamp):
+    header = pd.read_csv(input_file_path, nrows=0).columns
+
+    # Verify the CSV has enough columns
+    if len(header) < 8:
+        print(f"Warning: CSV file has only {len(header)} columns. Expected at least 8 columns.")
+        print("Proceeding with available columns...")
+
+    # Column C = index 2, Column E = index 4, Column H = index 7
+    wanted_indexes = [i for i in (2, 4, 7) if i < len(header)]
+    return header, wanted_indexes
+
+
+def read_columns_with_pyarrow(input_file_path, header, wanted_indexes):
     """
-    Process vulnerabilities data and create summary CSV.
-    
+    Read only the hostname, OS, and vulnerability columns using pyarrow.
+
+    pandas' pyarrow engine parses in parallel and skips every column that is
+    not requested, so the rest of the file is never materialized, and the
+    selected columns arrive with Arrow-backed dtypes -- whatever type the
+    engine infers -- so the later cleaning kernels never see a Python object
+    array. Empty and placeholder values ('nan', 'null', ...) are parsed
+    directly as nulls.
+
+    Args:
+        input_file_path (str): Path to the input CSV file
+        header (pd.Index): Column names from resolve_columns
+        wanted_indexes (list): Column indexes present in the file
+
+    Returns:
+        tuple: (hostnames, operating_systems, vulnerabilities) as pd.Series
+    """
+
+    if wanted_indexes:
+        df = pd.read_csv(input_file_path,
+                         usecols=[header[i] for i in wanted_indexes],
+                         engine='pyarrow', dtype_backend='pyarrow')
+    else:
+        df = pd.DataFrame()
+
+    def column_as_series(index):
+        if index not in wanted_indexes:
+            return pd.Series(dtype=str)
+        return df[header[index]]
+
+    return column_as_series(2), column_as_series(4), column_as_series(7)
+
+
+def count_columns_chunked(input_file_path, wanted_indexes):
+    """
+    Stream the CSV in chunks and count the three columns incrementally.
+
+    Fallback for when pyarrow is not installed: only one chunk of the three
+    needed columns is ever resident, with running Counter totals per summary,
+    so memory stays bounded regardless of file size.
+
     Args:
-        vuln_column (pd.Series): Series containing vulnerability data
+        input_file_path (str): Path to the input CSV file
+        wanted_indexes (list): Column indexes present in the file
+
+    Returns:
+        tuple: (host_counts, os_counts, vuln_counts) as pd.Series
+    """
+
+    counters = {2: Counter(), 4: Counter(), 7: Counter()}
+
+    if wanted_indexes:
+        chunks = pd.read_csv(input_file_path, usecols=wanted_indexes, header=0,
+                             dtype=str, chunksize=1_000_000, engine='c',
+                             na_filter=False)
+        for chunk in chunks:
+            for position, column_index in enumerate(wanted_indexes):
+                # Clean the data in one fused pass per row: whitespace strip
+                # and placeholder matching happen in a single traversal
+                # instead of separate strip and mask kernels
+                column = chunk.iloc[:, position].map(clean_token)
+
+                # OS keeps empty rows as 'Unknown'; hostname/vulnerability drop them
+                if column_index == 4:
+                    column = column.fillna('Unknown')
+                else:
+                    column = column.dropna()
+
+                # Dictionary-encode the chunk and count integer codes with
+                # bincount instead of hashing every string into the Counter;
+                # low-cardinality columns like OS collapse to a handful of
+                # codes per million rows
+                codes, uniques = pd.factorize(column)
+                counters[column_index].update(dict(zip(uniques, np.bincount(codes))))
+
+    return pd.Series(counters[2]), pd.Series(counters[4]), pd.Series(counters[7])
+
+
+def process_with_polars(input_file_path, output_directory, timestamp,
+                        output_format="csv"):
+    """
+    Generate all three summary reports using the polars lazy engine.
+
+    The input file is scanned lazily so only the three relevant columns are
+    ever materialized, and the three group-by counts are collected together
+    so they share a single pass over the file.
+
+    Args:
+        input_file_path (str): Path to the input CSV file
+        output_directory (str): Directory to save output files
+        timestamp (str): Timestamp string to append to the filenames
+        output_format (str): Output file format, "csv" or "parquet"
+
+    Returns:
+        bool: True if all summaries were generated successfully
+    """
+
+    print(f"Scanning CSV file: {input_file_path}")
+    lazy_frame = pl.scan_csv(
+        input_file_path,
+        has_header=True,
+        infer_schema_length=0,
+        ignore_errors=True,
+    )
+    columns = lazy_frame.collect_schema().names()
+
+    # Verify the CSV has enough columns
+    if len(columns) < 8:
+        print(f"Warning: CSV file has only {len(columns)} columns. Expected at least 8 columns.")
+        print("Proceeding with available columns...")
+
+    queries = []
+    for column_index, column_name, _, null_value in SUMMARY_SPECS:
+        if column_index >= len(columns):
+            queries.append(None)
+            continue
+
+        # Strip whitespace and normalize empty/placeholder values to null
+        cleaned = (
+            pl.nth(column_index)
+            .cast(pl.Utf8)
+            .str.strip_chars()
+            .replace({token: None for token in NULL_TOKENS})
+            .alias(column_name)
+        )
+        query = lazy_frame.select(cleaned)
+
+        # OS keeps null rows as 'Unknown'; hostname/vulnerability drop them
+        if null_value is not None:
+            query = query.with_columns(pl.col(column_name).fill_null(null_value))
+        else:
+            query = query.drop_nulls()
+
+        queries.append(
+            query.group_by(column_name)
+            .agg(pl.len().alias('Count'))
+            .sort(column_name)
+        )
+
+    # Collect all three summaries together so they share one file scan
+    results = pl.collect_all([q for q in queries if q is not None])
+    results_iter = iter(results)
+
+    output_paths = []
+    for query, (_, column_name, prefix, _) in zip(queries, SUMMARY_SPECS):
+        print(f"Processing {column_name} summary...")
+        if query is None:
+            counts = pl.DataFrame(schema={column_name: pl.Utf8, 'Count': pl.UInt32})
+        else:
+            counts = next(results_iter)
+
+        filename = f'{prefix}_{timestamp}.{output_format}'
+        output_path = os.path.join(output_directory, filename)
+        if output_format == 'parquet':
+            counts.write_parquet(output_path, compression='zstd')
+        else:
+            counts.write_csv(output_path)
+        print(f"  - Saved {column_name} summary to: {output_path}")
+        print(f"  - Found {len(counts)} unique values")
+        output_paths.append((column_name, output_path))
+
+    print("\nSummary Reports Generated Successfully!")
+    for column_name, output_path in output_paths:
+        print(f"- {column_name} Summary: {output_path}")
+
+    return True
+
+
+def ensure_string(series):
+    """
+    Return the Series with a string dtype, casting only when necessary.
+
+    The pyarrow reader already delivers Arrow-backed strings, so the common
+    case skips the full-column copy that an unconditional astype would make.
+
+    Args:
+        series (pd.Series): Raw column values
+
+    Returns:
+        pd.Series: The same Series, or a string[pyarrow] copy of it
+    """
+
+    if isinstance(series.dtype, pd.StringDtype):
+        return series
+    if isinstance(series.dtype, pd.ArrowDtype):
+        pyarrow_dtype = series.dtype.pyarrow_dtype
+        if pa.types.is_string(pyarrow_dtype) or pa.types.is_large_string(pyarrow_dtype):
+            return series
+    return series.astype('string[pyarrow]')
+
+
+def count_values(series):
+    """
+    Count occurrences of each unique value in a cleaned Series.
+
+    When pyarrow is available the counting runs through Arrow's native hash
+    aggregation directly over the string buffers, so no value is ever boxed
+    as a Python object.
+
+    Args:
+        series (pd.Series): Cleaned values with nulls already dropped
+
+    Returns:
+        pd.Series: Counts indexed by the unique values
+    """
+
+    if PYARROW_AVAILABLE:
+        result = pc.value_counts(pa.Array.from_pandas(series))
+        return pd.Series(result.field('counts').to_numpy(),
+                         index=result.field('values').to_pylist())
+    # sort=False skips the frequency sort; the output is ordered by value
+    # in write_counts anyway
+    return series.value_counts(sort=False)
+
+
+def process_with_duckdb(input_file_path, output_directory, timestamp,
+                        output_format="csv"):
+    """
+    Generate all three summary reports using DuckDB's vectorized engine.
+
+    Each summary is one grouped-count query over read_csv_auto written out
+    with COPY, so scanning, cleaning, aggregation, and CSV writing all run
+    inside DuckDB's parallel engine. Projection pushdown means each query
+    only ever reads the one column it summarizes.
+
+    Args:
+        input_file_path (str): Path to the input CSV file
+        output_directory (str): Directory to save output files
+        timestamp (str): Timestamp string to append to the filenames
+        output_format (str): Output file format, "csv" or "parquet"
+
+    Returns:
+        bool: True if all summaries were generated successfully
+    """
+
+    print(f"Querying CSV file: {input_file_path}")
+    con = duckdb.connect()
+    escaped_path = input_file_path.replace("'", "''")
+    source = f"read_csv_auto('{escaped_path}', header=true, all_varchar=true)"
+
+    header = [row[0] for row in con.execute(f"DESCRIBE SELECT * FROM {source}").fetchall()]
+
+    # Verify the CSV has enough columns
+    if len(header) < 8:
+        print(f"Warning: CSV file has only {len(header)} columns. Expected at least 8 columns.")
+        print("Proceeding with available columns...")
+
+    null_tokens = "(" + ", ".join(f"'{token}'" for token in NULL_TOKENS) + ")"
+    output_paths = []
+    for column_index, column_name, prefix, null_value in SUMMARY_SPECS:
+        print(f"Processing {column_name} summary...")
+        filename = f'{prefix}_{timestamp}.{output_format}'
+        output_path = os.path.join(output_directory, filename)
+
+        if column_index >= len(header):
+            empty = pd.DataFrame(columns=[column_name, 'Count'])
+            if output_format == 'parquet':
+                empty.to_parquet(output_path, index=False)
+            else:
+                empty.to_csv(output_path, index=False)
+            unique_count = 0
+        else:
+            identifier = '"' + header[column_index].replace('"', '""') + '"'
+            value = f"TRIM({identifier})"
+
+            # OS keeps null rows as 'Unknown'; hostname/vulnerability drop them
+            if null_value is not None:
+                select = (f"SELECT CASE WHEN {value} IS NULL OR {value} IN {null_tokens} "
+                          f"THEN '{null_value}' ELSE {value} END AS \"{column_name}\", "
+                          f"COUNT(*) AS \"Count\" FROM {source} GROUP BY 1 ORDER BY 1")
+            else:
+                select = (f"SELECT {value} AS \"{column_name}\", COUNT(*) AS \"Count\" "
+                          f"FROM {source} "
+                          f"WHERE {value} IS NOT NULL AND {value} NOT IN {null_tokens} "
+                          f"GROUP BY 1 ORDER BY 1")
+
+            if output_format == 'parquet':
+                copy_options = "(FORMAT PARQUET, COMPRESSION ZSTD)"
+            else:
+                copy_options = "(HEADER, DELIMITER ',')"
+            escaped_output = output_path.replace("'", "''")
+            unique_count = con.execute(
+                f"COPY ({select}) TO '{escaped_output}' {copy_options}"
+            ).fetchone()[0]
+
+        print(f"  - Saved {column_name} summary to: {output_path}")
+        print(f"  - Found {unique_count} unique values")
+        output_paths.append((column_name, output_path))
+
+    print("\nSummary Reports Generated Successfully!")
+    for column_name, output_path in output_paths:
+        print(f"- {column_name} Summary: {output_path}")
+
+    return True
+
+
+def write_counts(counts, column_name, filename_prefix, output_dir, timestamp,
+                 output_format="csv"):
+    """
+    Write a summary's value counts to a timestamped CSV or Parquet file.
+
+    Args:
+        counts (pd.Series): Counts indexed by the unique cleaned values
+        column_name (str): Header for the value column in the output file
+        filename_prefix (str): Prefix for the output filename
         output_dir (str): Directory to save the output file
         timestamp (str): Timestamp string to append to the filename
-    
+        output_format (str): Output file format, "csv" or "parquet"
+
     Returns:
-        str: Path to the saved CSV file or None if error
+        str: Path to the saved file or None if error
     """
-    
-    # Clean the data: strip whitespace and remove null/empty values
-    vuln_cleaned = vuln_column.astype(str).str.strip()
-    
-    # Remove empty strings, 'nan', and whitespace-only strings
-    vuln_cleaned = vuln_cleaned.replace(['', 'nan', 'NaN', 'null', 'NULL'], pd.NA)
-    vuln_cleaned = vuln_cleaned.replace(r'^\s*$', pd.NA, regex=True)
-    
-    # Drop null values for vulnerability processing
-    vuln_cleaned = vuln_cleaned.dropna()
-    
-    # Count occurrences of each vulnerability
-    vuln_counts = vuln_cleaned.value_counts().reset_index()
-    vuln_counts.columns = ['Vulnerability', 'Count']
-    
-    # Sort alphabetically by Vulnerability
-    vuln_counts = vuln_counts.sort_values('Vulnerability').reset_index(drop=True)
-    
-    # Save to CSV
-    filename = f'vuln_{timestamp}.csv'
+
+    if output_format == 'parquet' and not PYARROW_AVAILABLE:
+        with PRINT_LOCK:
+            print("Warning: parquet output requires pyarrow. Writing CSV instead.")
+        output_format = 'csv'
+
+    # Sort alphabetically by value while the counts are still a Series --
+    # one sort over the unique keys, no DataFrame round-trip
+    summary = counts.sort_index().rename_axis(column_name).reset_index(name='Count')
+
+    # Counts rarely exceed 32 bits; downcast from int64 so the write path
+    # formats and buffers the smallest integer type that fits
+    summary['Count'] = pd.to_numeric(summary['Count'], downcast='unsigned')
+
+    # Save the file; pyarrow's writers format in C++ with large buffered
+    # writes instead of formatting each row in Python
+    filename = f'{filename_prefix}_{timestamp}.{output_format}'
     output_path = os.path.join(output_dir, filename)
     try:
-        vuln_counts.to_csv(output_path, index=False)
-        print(f"  - Saved vulnerability summary to: {output_path}")
-        print(f"  - Found {len(vuln_counts)} unique vulnerabilities")
+        if output_format == 'parquet':
+            pq.write_table(pa.Table.from_pandas(summary, preserve_index=False),
+                           output_path, compression='zstd')
+        elif PYARROW_AVAILABLE:
+            pac.write_csv(pa.Table.from_pandas(summary, preserve_index=False),
+                          output_path,
+                          write_options=pac.WriteOptions(include_header=True,
+                                                         quoting_style='needed'))
+        else:
+            summary.to_csv(output_path, index=False)
+        with PRINT_LOCK:
+            print(f"  - Saved {column_name} summary to: {output_path}")
+            print(f"  - Found {len(summary)} unique values")
         return output_path
     except Exception as e:
-        print(f"  - Error saving vulnerability summary: {e}")
+        with PRINT_LOCK:
+            print(f"  - Error saving {column_name} summary: {e}")
         return None
 
 
@@ -221,22 +620,29 @@ def main():
     
     # Configuration: Set your input file path here
     DEFAULT_INPUT_FILE = "input_data.csv"  # Change this to your CSV file path
-    
-    # Check if file path is provided as command line argument
-    if len(sys.argv) > 1:
-        input_file = sys.argv[1]
-    else:
+
+    parser = argparse.ArgumentParser(
+        description="Process a server CSV export into OS, hostname, and vulnerability summaries."
+    )
+    parser.add_argument("input_file", nargs="?", default=None,
+                        help="Path to the input CSV file")
+    parser.add_argument("output_directory", nargs="?", default=None,
+                        help="Directory to save the summary files")
+    parser.add_argument("--backend", choices=["polars", "pandas", "duckdb"], default="polars",
+                        help="Processing backend (default: polars)")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv",
+                        help="Output file format (default: csv)")
+    args = parser.parse_args()
+
+    input_file = args.input_file
+    if input_file is None:
         input_file = DEFAULT_INPUT_FILE
         print(f"No input file specified. Using default: {DEFAULT_INPUT_FILE}")
         print("Usage: python csv_processor.py <input_csv_file> [output_directory]")
-    
-    # Check if output directory is provided as command line argument
-    output_dir = None
-    if len(sys.argv) > 2:
-        output_dir = sys.argv[2]
-    
+
     # Process the CSV file
-    success = process_csv_file(input_file, output_dir)
+    success = process_csv_file(input_file, args.output_directory, backend=args.backend,
+                               output_format=args.format)
     
     if success:
         print("\n✅ Script completed successfully!")